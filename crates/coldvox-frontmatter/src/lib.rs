@@ -0,0 +1,98 @@
+//! Fast markdown frontmatter parser for the docs tooling.
+//!
+//! Mirrors the pure-Python parser in `scripts/_docs_cache.py`: mmap the file,
+//! locate the closing `\n---` sentinel with a SIMD byte search, and build a
+//! dict from the `key: value` lines of the header. The Python scripts import
+//! this module opportunistically and fall back to the Python implementation
+//! when it is not built.
+
+use memchr::memmem;
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+
+/// Trim ASCII whitespace from both ends of a byte slice.
+fn trim(bytes: &[u8]) -> &[u8] {
+    let start = bytes
+        .iter()
+        .position(|b| !b.is_ascii_whitespace())
+        .unwrap_or(bytes.len());
+    let end = bytes
+        .iter()
+        .rposition(|b| !b.is_ascii_whitespace())
+        .map_or(start, |i| i + 1);
+    &bytes[start..end]
+}
+
+/// Strip at most one leading and one trailing quote character, independently.
+fn strip_quotes(bytes: &[u8]) -> &[u8] {
+    let mut out = bytes;
+    if matches!(out.first(), Some(b'\'' | b'"')) {
+        out = &out[1..];
+    }
+    if matches!(out.last(), Some(b'\'' | b'"')) {
+        out = &out[..out.len() - 1];
+    }
+    out
+}
+
+/// Keys must look like identifiers (with hyphens), matching the Python regex.
+fn is_key(bytes: &[u8]) -> bool {
+    match bytes.first() {
+        Some(b) if b.is_ascii_alphabetic() || *b == b'_' => {}
+        _ => return false,
+    }
+    bytes[1..]
+        .iter()
+        .all(|b| b.is_ascii_alphanumeric() || *b == b'_' || *b == b'-')
+}
+
+/// Parse the frontmatter of the markdown file at `path`.
+///
+/// Returns `(metadata, err)` where `err` is empty on success, mirroring the
+/// Python `parse_frontmatter` contract.
+#[pyfunction]
+fn parse_frontmatter(py: Python<'_>, path: &str) -> PyResult<(Py<PyDict>, String)> {
+    let values = PyDict::new(py);
+
+    let file = std::fs::File::open(path)?;
+    if file.metadata()?.len() == 0 {
+        return Ok((values.unbind(), "missing frontmatter".to_string()));
+    }
+    let map = unsafe { memmap2::Mmap::map(&file)? };
+    let data: &[u8] = &map;
+
+    if !data.starts_with(b"---\n") {
+        return Ok((values.unbind(), "missing frontmatter".to_string()));
+    }
+    let header = match memmem::find(&data[4..], b"\n---") {
+        Some(closing) => &data[4..4 + closing],
+        None => return Ok((values.unbind(), "unterminated frontmatter".to_string())),
+    };
+
+    for line in header.split(|b| *b == b'\n') {
+        let line = trim(line);
+        if line.is_empty() || line[0] == b'#' {
+            continue;
+        }
+        let Some(colon) = memchr::memchr(b':', line) else {
+            continue;
+        };
+        let key = trim(&line[..colon]);
+        if !is_key(key) {
+            continue;
+        }
+        let value = strip_quotes(trim(&line[colon + 1..]));
+        values.set_item(
+            String::from_utf8_lossy(key),
+            String::from_utf8_lossy(value),
+        )?;
+    }
+
+    Ok((values.unbind(), String::new()))
+}
+
+#[pymodule]
+fn coldvox_frontmatter(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(parse_frontmatter, m)?)?;
+    Ok(())
+}
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Shared docs traversal with an mtime-keyed frontmatter cache.
+
+`build_docs_index.py` and `backfill_doc_review_metadata.py` each need the
+frontmatter of every markdown file under docs/. When the scripts run
+back-to-back (as in CI) re-walking and re-parsing every file is wasted work,
+so `iter_docs()` memoizes parses by `(path, st_mtime_ns)` in a JSON cache at
+`docs/.frontmatter_cache.json`.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    # Optional fast path: crates/coldvox-frontmatter built via maturin.
+    from coldvox_frontmatter import parse_frontmatter as _parse_frontmatter_rs
+except ImportError:
+    _parse_frontmatter_rs = None
+
+CACHE_PATH = Path("docs/.frontmatter_cache.json")
+
+# One multiline pass over the header bytes replaces the per-line
+# strip/startswith/split dance; quote stripping is folded into the pattern.
+_HEADER_KEY_RE = re.compile(
+    rb"^\s*(?!#)([A-Za-z_][A-Za-z0-9_-]*)\s*:\s*['\"]?(.*?)['\"]?\s*$", re.M
+)
+
+
+def parse_frontmatter(path: Path) -> Tuple[Dict, str]:
+    """Returns (metadata, err). err is "" when the frontmatter parsed cleanly."""
+    if _parse_frontmatter_rs is not None:
+        return _parse_frontmatter_rs(str(path))
+    # mmap the file and scan for the closing delimiter as raw bytes so the
+    # (potentially large) body is never decoded or copied into a Python str.
+    with path.open("rb") as handle:
+        try:
+            mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped and have no frontmatter anyway.
+            return {}, "missing frontmatter"
+        with mm:
+            if mm[:4] != b"---\n":
+                return {}, "missing frontmatter"
+            closing = mm.find(b"\n---", 4)
+            if closing == -1:
+                return {}, "unterminated frontmatter"
+            header = mm[4:closing]
+            values = {
+                match.group(1).decode("utf-8"): match.group(2).decode("utf-8")
+                for match in _HEADER_KEY_RE.finditer(header)
+            }
+    return values, ""
+
+
+def walk_md(root: str) -> Iterator[Tuple[str, int]]:
+    """Yield (path, st_mtime_ns) for every .md file under root.
+
+    Manual os.scandir recursion is markedly faster than Path.rglob: DirEntry
+    answers is_dir/is_file from the directory read and its cached stat gives
+    us st_mtime_ns without a second syscall, and no PurePath objects are
+    allocated in the hot loop.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    yield entry.path, entry.stat(follow_symlinks=False).st_mtime_ns
+
+
+def load_cache() -> Dict:
+    try:
+        return json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache: Dict) -> None:
+    CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+
+
+def iter_docs(root: Path = Path("docs")) -> Iterator[Tuple[Path, Dict, str]]:
+    """Yield (path, metadata, err) for every markdown file under root, sorted.
+
+    Unchanged files (matching st_mtime_ns) are served from the JSON cache so
+    sequential script runs only pay for the walk, not the parse.
+    """
+    cache = load_cache()
+    dirty = False
+    # Sort on path components to keep the ordering rglob+sorted used to give.
+    found = sorted(walk_md(str(root)), key=lambda item: item[0].split(os.sep))
+    paths = [Path(str_path) for str_path, _ in found]
+
+    results: List[Tuple[Path, Dict, str]] = [None] * len(found)  # type: ignore[list-item]
+    pending: List[int] = []
+    for idx, (path, (_, mtime_ns)) in enumerate(zip(paths, found)):
+        entry = cache.get(path.as_posix())
+        if entry is not None and entry.get("mtime_ns") == mtime_ns:
+            results[idx] = (path, entry["meta"], entry["err"])
+        else:
+            pending.append(idx)
+
+    if pending:
+        # Parsing is I/O-bound (open/mmap/close of many small files), so a
+        # thread pool overlaps the syscalls; results slot back in walk order.
+        workers = min(32, (os.cpu_count() or 1) * 4, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            parsed = pool.map(
+                parse_frontmatter, (paths[i] for i in pending), chunksize=16
+            )
+            for idx, (metadata, err) in zip(pending, parsed):
+                cache[paths[idx].as_posix()] = {
+                    "mtime_ns": found[idx][1],
+                    "meta": metadata,
+                    "err": err,
+                }
+                results[idx] = (paths[idx], metadata, err)
+        dirty = True
+
+    # Drop entries for deleted files so the cache does not grow unboundedly.
+    seen = {path.as_posix() for path in paths}
+    for stale in [key for key in cache if key not in seen]:
+        del cache[stale]
+        dirty = True
+
+    if dirty:
+        save_cache(cache)
+    return iter(results)
@@ -7,42 +7,52 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import os
+import re
 from pathlib import Path
 
+from _docs_cache import iter_docs
+
+_OWNERS_RE = re.compile(rb"^owners:\s*(.+?)\s*$", re.M)
+
 
 def update_file(path: Path, review_due: str, apply_changes: bool) -> bool:
-    text = path.read_text(encoding="utf-8")
-    if not text.startswith("---\n"):
+    # Work on raw bytes: the (large) body tail is spliced back verbatim below,
+    # never paying a decode -> format -> encode round-trip of the whole file.
+    data = path.read_bytes()
+    if not data.startswith(b"---\n"):
         return False
-    try:
-        close_idx = text.index("\n---", 4)
-    except ValueError:
+    close_idx = data.find(b"\n---", 4)
+    if close_idx == -1:
         return False
 
-    header = text[4:close_idx]
-    body = text[close_idx + 4 :]
-    lines = header.splitlines()
-    keys = {line.split(":", 1)[0].strip() for line in lines if ":" in line}
-    changed = False
-
-    owners_value = "Documentation Working Group"
-    for line in lines:
-        if line.startswith("owners:"):
-            owners_value = line.split(":", 1)[1].strip()
-            break
+    header = data[4:close_idx]
+    # Substring probes on the header bytes replace the old splitlines/rejoin:
+    # in the common nothing-to-do case no lists or strings are built at all.
+    need_reviewer = not (
+        header.startswith(b"last_reviewer:") or b"\nlast_reviewer:" in header
+    )
+    need_due = not (header.startswith(b"review_due:") or b"\nreview_due:" in header)
+    if not (need_reviewer or need_due):
+        return False
 
-    if "last_reviewer" not in keys:
-        lines.append(f"last_reviewer: {owners_value}")
-        changed = True
-    if "review_due" not in keys:
-        lines.append(f"review_due: {review_due}")
-        changed = True
+    additions = b""
+    if need_reviewer:
+        # One C-level regex scan of the header instead of a per-line loop.
+        match = _OWNERS_RE.search(header)
+        owners_value = match.group(1) if match else b"Documentation Working Group"
+        additions += b"\nlast_reviewer: " + owners_value
+    if need_due:
+        additions += b"\nreview_due: " + review_due.encode("utf-8")
 
-    if changed and apply_changes:
-        new_header = "\n".join(lines)
-        path.write_text(f"---\n{new_header}\n---{body}", encoding="utf-8")
+    if apply_changes:
+        # Write through a temp file and os.replace so an interrupted run never
+        # leaves a half-written doc behind.
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(data[:close_idx] + additions + data[close_idx:])
+        os.replace(tmp, path)
 
-    return changed
+    return True
 
 
 def main() -> None:
@@ -58,9 +68,13 @@ def main() -> None:
 
     review_due = (dt.date.today() + dt.timedelta(days=args.days)).isoformat()
     changed_files = []
-    for path in sorted(Path("docs").rglob("*.md")):
+    for path, metadata, err in iter_docs(Path("docs")):
         if path.name == "index.md":
             continue
+        # The shared walk already parsed the header: skip files that cannot be
+        # updated or that carry both keys without re-reading them.
+        if err or ("last_reviewer" in metadata and "review_due" in metadata):
+            continue
         if update_file(path, review_due, args.apply):
             changed_files.append(path)
 
@@ -4,50 +4,30 @@
 from __future__ import annotations
 
 import datetime as dt
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from _docs_cache import iter_docs
+
 DOCS_ROOT = Path("docs")
 INDEX_PATH = DOCS_ROOT / "index.md"
 
-CORE_KEYS = {"doc_type", "subsystem", "status"}
-INFO_KEYS = {"freshness", "preservation"}
+CORE_KEYS = frozenset({"doc_type", "subsystem", "status"})
+INFO_KEYS = frozenset({"freshness", "preservation"})
 GRACE_PERIOD_END = dt.date(2026, 3, 11)
 
 VALID_FRESHNESS = {"current", "aging", "stale", "historical", "dead"}
 VALID_PRESERVATION = {"reference", "preserve", "summarize", "delete"}
 
-
-def parse_frontmatter(path: Path) -> Tuple[Dict, str]:
-    text = path.read_text(encoding="utf-8")
-    if not text.startswith("---\n"):
-        return {}, "missing frontmatter"
-    try:
-        closing = text.index("\n---", 4)
-    except ValueError:
-        return {}, "unterminated frontmatter"
-
-    header = text[4:closing]
-    values: Dict = {}
-    for line in header.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or ":" not in stripped:
-            continue
-        key, raw = stripped.split(":", 1)
-        values[key.strip()] = raw.strip().strip("'\"")
-    return values, ""
+# Resolved once per run: classify_doc consults this per doc, and a short-lived
+# script cannot legitimately cross a date boundary mid-run anyway.
+TODAY = dt.date.today()
 
 
-def load_existing_index_meta() -> Dict:
-    if not INDEX_PATH.exists():
-        return {}
-    meta, err = parse_frontmatter(INDEX_PATH)
-    if err:
-        return {}
-    return meta
-
-
-def classify_doc(metadata: Dict, err: str, path: Path) -> Tuple[str, str, str]:
+def classify_doc(metadata: Dict, err: str, in_archive: bool) -> Tuple[str, str, str]:
     """Returns (freshness, preservation, status_note)."""
     if err:
         return "invalid", "unknown", err
@@ -60,12 +40,21 @@ def classify_doc(metadata: Dict, err: str, path: Path) -> Tuple[str, str, str]:
     if preservation not in VALID_PRESERVATION:
         preservation = "unclassified"
 
-    missing_core = CORE_KEYS - set(metadata.keys())
+    # The columns hold only a handful of distinct tokens; interning them lets
+    # the == checks in bucket_rows and the Counters hit CPython's identity
+    # fast path instead of comparing characters.
+    freshness = sys.intern(freshness)
+    preservation = sys.intern(preservation)
+
+    # Set difference accepts the dict keys view directly; no per-call set()
+    # copies of the metadata keys.
+    keys = metadata.keys()
+    missing_core = CORE_KEYS - keys
     if missing_core:
         return "invalid", "unknown", f"missing core: {', '.join(sorted(missing_core))}"
 
-    missing_info = INFO_KEYS - set(metadata.keys())
-    if missing_info and dt.date.today() >= GRACE_PERIOD_END:
+    missing_info = INFO_KEYS - keys
+    if missing_info and TODAY >= GRACE_PERIOD_END:
         return freshness, preservation, f"missing info keys (grace period ended)"
     elif missing_info:
         return (
@@ -74,27 +63,64 @@ def classify_doc(metadata: Dict, err: str, path: Path) -> Tuple[str, str, str]:
             f"missing info keys (warn until {GRACE_PERIOD_END})",
         )
 
-    if freshness == "dead" and "archive" not in path.parts:
+    if freshness == "dead" and not in_archive:
         return freshness, preservation, "dead doc outside archive"
 
     return freshness, preservation, ""
 
 
-def collect_docs() -> List[Tuple[Path, Dict, str, str, str]]:
-    """Returns list of (path, metadata, freshness, preservation, note)."""
-    docs: List[Tuple[Path, Dict, str, str, str]] = []
-    for path in sorted(DOCS_ROOT.rglob("*.md")):
-        if path == INDEX_PATH:
-            continue
-        metadata, err = parse_frontmatter(path)
-        freshness, preservation, note = classify_doc(metadata, err, path)
-        docs.append((path, metadata, freshness, preservation, note))
-    return docs
+@dataclass
+class Rows:
+    """Column-oriented (SoA) layout for collected docs.
+
+    Filter predicates and counters scan only the short freshness/
+    preservation/note columns instead of unpacking 5-tuples per row.
+    """
+
+    paths: List[Path] = field(default_factory=list)
+    metas: List[Dict] = field(default_factory=list)
+    freshness: List[str] = field(default_factory=list)
+    preservation: List[str] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+    # "archive" membership is computed once per path here; scanning
+    # path.parts repeatedly in every consumer re-split the path four times.
+    in_archive: List[bool] = field(default_factory=list)
 
+    def __len__(self) -> int:
+        return len(self.paths)
 
-def build_summary_table(rows: List[Tuple], title: str, filter_fn) -> str:
+
+def collect_docs() -> Tuple[Rows, Dict]:
+    """Collect doc columns plus the existing index.md frontmatter.
+
+    The walk already visits index.md, so its metadata is captured here
+    instead of a separate exists/read/parse in main().
+    """
+    rows = Rows()
+    index_meta: Dict = {}
+    for path, metadata, err in iter_docs(DOCS_ROOT):
+        if path == INDEX_PATH:
+            if not err:
+                index_meta = metadata
+            continue
+        in_archive = "archive" in path.parts
+        freshness, preservation, note = classify_doc(metadata, err, in_archive)
+        rows.paths.append(path)
+        rows.metas.append(metadata)
+        rows.freshness.append(freshness)
+        rows.preservation.append(preservation)
+        rows.notes.append(note)
+        rows.in_archive.append(in_archive)
+    return rows, index_meta
+
+
+def build_summary_table(rows: Rows, title: str, filter_fn) -> str:
     """Build a table for docs matching filter_fn."""
-    filtered = [r for r in rows if filter_fn(r)]
+    filtered = [
+        r
+        for r in zip(rows.paths, rows.metas, rows.freshness, rows.preservation, rows.notes)
+        if filter_fn(r)
+    ]
     if not filtered:
         return f"## {title}\n\nNone.\n"
 
@@ -115,115 +141,110 @@ def build_summary_table(rows: List[Tuple], title: str, filter_fn) -> str:
     return "\n".join(lines) + "\n"
 
 
-def build_action_table(rows: List[Tuple]) -> str:
-    """Build table of docs needing action."""
-
-    def needs_action(r):
-        _, _, fresh, pres, note = r
-        return (
-            bool(note)
-            or fresh == "invalid"
-            or (fresh == "dead" and "archive" not in r[0].parts)
-        )
-
-    filtered = [r for r in rows if needs_action(r)]
-    if not filtered:
-        return "## Action Required\n\nNo docs require immediate action.\n"
-
-    lines = [
-        "## Action Required\n",
-        "| File | Issue | Suggested Action |",
-        "| --- | --- | --- |",
-    ]
-    for path, meta, fresh, pres, note in filtered:
-        rel = path.as_posix()
-        if "missing frontmatter" in note:
-            action = "Add frontmatter"
-        elif "dead doc outside archive" in note:
-            action = "Move to docs/archive/ or delete"
-        elif "missing core" in note:
-            action = "Add missing core fields"
-        elif "missing info keys" in note:
-            action = "Add freshness and preservation"
-        else:
-            action = "Review and fix"
-        lines.append(f"| `{rel}` | {note or fresh} | {action} |")
-
-    return "\n".join(lines) + "\n"
-
-
-def build_preserve_table(rows: List[Tuple]) -> str:
-    """Build table of docs with valuable ideas to preserve."""
-
-    def should_preserve(r):
-        _, _, fresh, pres, _ = r
-        return pres in ("preserve", "reference") and fresh in (
-            "current",
-            "aging",
-            "stale",
-        )
-
-    filtered = [r for r in rows if should_preserve(r)]
-    if not filtered:
-        return "## Preserve These Ideas\n\nNo docs marked for preservation.\n"
-
-    lines = [
-        "## Preserve These Ideas\n",
-        "| File | Summary | Preservation | Signals |",
-        "| --- | --- | --- | --- |",
-    ]
-    for path, meta, fresh, pres, _ in filtered:
+def bucket_rows(rows: Rows) -> Tuple[List[str], List[str], List[str]]:
+    """Classify every row into its tables in a single pass.
+
+    Returns pre-formatted table lines for (action, preserve, archive). A row
+    may land in several buckets; fusing the three filter+format loops means
+    rows and their paths are only touched once.
+    """
+    action: List[str] = []
+    preserve: List[str] = []
+    archive: List[str] = []
+    for path, meta, fresh, pres, note, in_archive in zip(
+        rows.paths,
+        rows.metas,
+        rows.freshness,
+        rows.preservation,
+        rows.notes,
+        rows.in_archive,
+    ):
         rel = path.as_posix()
-        summary = meta.get("summary", "")[:50]
-        signals = meta.get("signals", "")[:40]
-        if isinstance(signals, str):
-            signals = signals.strip("[]").replace("'", "").replace('"', "")
-        lines.append(f"| `{rel}` | {summary} | {pres} | {signals} |")
-
-    return "\n".join(lines) + "\n"
+        dead_outside = fresh == "dead" and not in_archive
+
+        if note or fresh == "invalid" or dead_outside:
+            if "missing frontmatter" in note:
+                act = "Add frontmatter"
+            elif "dead doc outside archive" in note:
+                act = "Move to docs/archive/ or delete"
+            elif "missing core" in note:
+                act = "Add missing core fields"
+            elif "missing info keys" in note:
+                act = "Add freshness and preservation"
+            else:
+                act = "Review and fix"
+            action.append(f"| `{rel}` | {note or fresh} | {act} |\n")
+
+        if pres in ("preserve", "reference") and fresh in ("current", "aging", "stale"):
+            summary = meta.get("summary", "")[:50]
+            signals = meta.get("signals", "")[:40]
+            if isinstance(signals, str):
+                signals = signals.strip("[]").replace("'", "").replace('"', "")
+            preserve.append(f"| `{rel}` | {summary} | {pres} | {signals} |\n")
+
+        if pres == "delete" or fresh == "dead" or pres == "summarize":
+            if pres == "delete":
+                reason = "No salvage value"
+            elif pres == "summarize":
+                reason = "Fold into other docs"
+            elif fresh == "dead":
+                reason = "References removed code"
+            else:
+                reason = "Low value"
+            archive.append(f"| `{rel}` | {reason} | {pres} |\n")
+
+    return action, preserve, archive
+
+
+def build_action_table(out: List[str], table_lines: List[str]) -> None:
+    """Append the table of docs needing action to the output buffer."""
+    if not table_lines:
+        out.append("## Action Required\n\nNo docs require immediate action.\n")
+        return
+
+    out.append(
+        "## Action Required\n\n"
+        "| File | Issue | Suggested Action |\n"
+        "| --- | --- | --- |\n"
+    )
+    out.extend(table_lines)
 
 
-def build_archive_table(rows: List[Tuple]) -> str:
-    """Build table of docs safe to archive or delete."""
+def build_preserve_table(out: List[str], table_lines: List[str]) -> None:
+    """Append the table of docs with valuable ideas to preserve."""
+    if not table_lines:
+        out.append("## Preserve These Ideas\n\nNo docs marked for preservation.\n")
+        return
 
-    def should_archive(r):
-        _, _, fresh, pres, _ = r
-        return pres == "delete" or fresh == "dead" or pres == "summarize"
+    out.append(
+        "## Preserve These Ideas\n\n"
+        "| File | Summary | Preservation | Signals |\n"
+        "| --- | --- | --- | --- |\n"
+    )
+    out.extend(table_lines)
 
-    filtered = [r for r in rows if should_archive(r)]
-    if not filtered:
-        return "## Safe to Archive/Delete\n\nNo docs flagged for archival.\n"
 
-    lines = [
-        "## Safe to Archive/Delete\n",
-        "| File | Reason | Preservation |",
-        "| --- | --- | --- |",
-    ]
-    for path, meta, fresh, pres, _ in filtered:
-        rel = path.as_posix()
-        if pres == "delete":
-            reason = "No salvage value"
-        elif pres == "summarize":
-            reason = "Fold into other docs"
-        elif fresh == "dead":
-            reason = "References removed code"
-        else:
-            reason = "Low value"
-        lines.append(f"| `{rel}` | {reason} | {pres} |")
+def build_archive_table(out: List[str], table_lines: List[str]) -> None:
+    """Append the table of docs safe to archive or delete."""
+    if not table_lines:
+        out.append("## Safe to Archive/Delete\n\nNo docs flagged for archival.\n")
+        return
 
-    return "\n".join(lines) + "\n"
+    out.append(
+        "## Safe to Archive/Delete\n\n"
+        "| File | Reason | Preservation |\n"
+        "| --- | --- | --- |\n"
+    )
+    out.extend(table_lines)
 
 
-def build_stats(rows: List[Tuple]) -> str:
+def build_stats(out: List[str], rows: Rows) -> None:
     total = len(rows)
-    archived_count = sum(1 for r in rows if "archive" in r[0].parts)
+    archived_count = sum(rows.in_archive)
     active_count = total - archived_count
 
-    by_freshness = {}
-    by_preservation = {}
-    for _, _, fresh, pres, note in rows:
-        by_freshness[fresh] = by_freshness.get(fresh, 0) + 1
-        by_preservation[pres] = by_preservation.get(pres, 0) + 1
+    by_freshness = Counter(rows.freshness)
+    by_preservation = Counter(rows.preservation)
 
     invalid_count = by_freshness.get("invalid", 0)
 
@@ -243,28 +264,21 @@ def build_stats(rows: List[Tuple]) -> str:
     for p in sorted(by_preservation.keys()):
         lines.append(f"- {p}: {by_preservation[p]}")
 
-    return "\n".join(lines) + "\n"
+    out.extend(line + "\n" for line in lines)
 
 
 def main() -> None:
-    rows = collect_docs()
-    existing = load_existing_index_meta()
-    today = dt.date.today().isoformat()
+    rows, existing = collect_docs()
+    today = TODAY.isoformat()
 
     index_last_reviewed = existing.get("last_reviewed", today)
 
-    sections = [
-        build_stats(rows),
-        "",
-        "---\n",
-        build_action_table(rows),
-        "",
-        build_preserve_table(rows),
-        "",
-        build_archive_table(rows),
-    ]
+    action_lines, preserve_lines, archive_lines = bucket_rows(rows)
 
-    content = f"""---
+    # Sections append small strings to one shared buffer that is joined once
+    # at write time, instead of each table join producing its own big string.
+    out: List[str] = [
+        f"""---
 doc_type: index
 subsystem: general
 version: 2.0.0
@@ -276,24 +290,32 @@ preservation: reference
 summary: "Auto-generated documentation index with freshness and preservation status"
 ---
 
-{chr(10).join(sections)}
 """
-
-    INDEX_PATH.write_text(content, encoding="utf-8")
+    ]
+    build_stats(out, rows)
+    out.append("\n\n---\n\n")
+    build_action_table(out, action_lines)
+    out.append("\n\n")
+    build_preserve_table(out, preserve_lines)
+    out.append("\n\n")
+    build_archive_table(out, archive_lines)
+    out.append("\n")
+
+    INDEX_PATH.write_text("".join(out), encoding="utf-8")
     print(f"wrote {INDEX_PATH}")
 
-    invalid = sum(1 for r in rows if r[2] == "invalid")
-    dead_outside = sum(
-        1 for r in rows if r[2] == "dead" and "archive" not in r[0].parts
-    )
+    # One pass over (freshness, in_archive) pairs feeds both warning counts.
+    status_counts = Counter(zip(rows.freshness, rows.in_archive))
+    invalid = status_counts["invalid", True] + status_counts["invalid", False]
+    dead_outside = status_counts["dead", False]
 
     if invalid > 0:
         print(f"[WARN] {invalid} docs have invalid frontmatter")
     if dead_outside > 0:
         print(f"[ERROR] {dead_outside} dead docs found outside archive/")
 
-    needs_info = sum(1 for r in rows if "missing info keys" in r[4])
-    if needs_info > 0 and dt.date.today() < GRACE_PERIOD_END:
+    needs_info = sum(1 for note in rows.notes if "missing info keys" in note)
+    if needs_info > 0 and TODAY < GRACE_PERIOD_END:
         print(
             f"[INFO] {needs_info} docs missing freshness/preservation (grace period until {GRACE_PERIOD_END})"
         )
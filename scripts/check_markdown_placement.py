@@ -2,53 +2,46 @@
 """Pre-commit hook: Block Markdown files outside docs/ except approved exceptions."""
 from __future__ import annotations
 
+import re
 import sys
-from pathlib import Path
 
-APPROVED_EXCEPTIONS = {
-    Path("README.md"),
-    Path("CHANGELOG.md"),
-    Path("AGENTS.md"),
-    Path(".github/pull_request_template.md"),
-}
+APPROVED_EXCEPTIONS = frozenset({
+    "README.md",
+    "CHANGELOG.md",
+    "AGENTS.md",
+    ".github/pull_request_template.md",
+})
 
-# Pattern-based exceptions
-def is_crate_readme(path: Path) -> bool:
-    """Check if path is a crate README under crates/*/README.md."""
-    return (
-        len(path.parts) >= 3
-        and path.parts[0] == "crates"
-        and path.name == "README.md"
-    )
-
-def is_pr_assessment(path: Path) -> bool:
-    """Check if path is a PR assessment file (PR-NNN-*.md at root)."""
-    return (
-        len(path.parts) == 1
-        and path.name.startswith("PR-")
-        and path.suffix == ".md"
-    )
+# Pattern-based exceptions, compiled once into a single alternation:
+# - crate READMEs under crates/*/README.md (any depth below crates/)
+# - PR assessment files (PR-NNN-*.md at repo root)
+# One regex match per path replaces Path construction plus parts/name/suffix
+# probes for every staged file.
+_PATTERN_EXCEPTIONS_RE = re.compile(r"\A(?:crates/.+/README\.md|PR-[^/]*\.md)\Z")
 
 
 def main() -> int:
     """Check all staged markdown files are in docs/ or approved exceptions."""
-    files = [Path(arg) for arg in sys.argv[1:]]
-    markdown_files = [f for f in files if f.suffix == ".md"]
-
-    errors: list[Path] = []
-    for path in markdown_files:
-        # Approved root-level exceptions
-        if path in APPROVED_EXCEPTIONS:
+    args = sys.argv[1:]
+    if args and args[0] == "--stdin":
+        # NUL-delimited paths on stdin (e.g. `git diff -z --name-only |
+        # check_markdown_placement.py --stdin`) let one interpreter handle an
+        # arbitrarily large file list instead of paying Python startup per
+        # xargs batch, and NUL delimiting is safe for any filename.
+        args = [path for path in sys.stdin.read().split("\0") if path]
+    errors: list[str] = []
+    for arg in args:
+        if not arg.endswith(".md"):
             continue
-        # Crate READMEs are allowed
-        if is_crate_readme(path):
+        # Cheap string checks first: almost every staged file is either under
+        # docs/ or an approved root file, so one prefix test plus one set
+        # lookup usually decides it. The rarer pattern-based exceptions
+        # (crate READMEs, PR assessments) only run for the remainder.
+        if arg.startswith("docs/") or arg in APPROVED_EXCEPTIONS:
             continue
-        # PR assessment files are allowed
-        if is_pr_assessment(path):
+        if _PATTERN_EXCEPTIONS_RE.match(arg):
             continue
-        # Must be under docs/
-        if path.parts[0] != "docs":
-            errors.append(path)
+        errors.append(arg)
 
     if errors:
         print("\n❌ ERROR: Markdown files outside /docs are not allowed:\n")
@@ -5,9 +5,17 @@ from __future__ import annotations
 import argparse
 import csv
 import datetime as dt
+import io
 import subprocess
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    # Optional fast path: libgit2 computes the diff in-process, skipping the
+    # git fork (and its ~50ms startup) on every pre-commit/CI invocation.
+    import pygit2
+except ImportError:
+    pygit2 = None
 
 ACTION_MAP: Dict[str, str] = {
     "A": "added",
@@ -18,26 +26,71 @@ ACTION_MAP: Dict[str, str] = {
 }
 
 
-def git_diff_status(base: str, head: str) -> List[str]:
-    result = subprocess.run(
-        ["git", "diff", "--name-status", base, head],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return [line.strip() for line in result.stdout.splitlines() if line.strip()]
+def _nul_fields(stream) -> Iterator[bytes]:
+    """Yield NUL-delimited fields from a binary stream without buffering it whole."""
+    buffer = bytearray()
+    while True:
+        chunk = stream.read(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        start = 0
+        while True:
+            end = buffer.find(b"\0", start)
+            if end == -1:
+                break
+            yield bytes(buffer[start:end])
+            start = end + 1
+        del buffer[:start]
+    if buffer:
+        yield bytes(buffer)
 
 
-def parse_status(line: str) -> List[tuple[str, Path]]:
-    parts = line.split("\t")
-    status = parts[0]
-    if status.startswith("R") or status.startswith("C"):
-        # Format: R100\told\tnew
-        new_path = Path(parts[-1])
-        return [(status[0], new_path)]
-    code = status[0]
-    path = Path(parts[1])
-    return [(code, path)]
+def _diff_docs_pygit2(base: str, head: str) -> List[Tuple[str, str]]:
+    """In-process diff via libgit2: no fork, and deltas arrive structurally."""
+    repo = pygit2.Repository(".")
+    diff = repo.diff(base, head)
+    # Match `git diff --name-status`, which folds renames/copies into R/C.
+    diff.find_similar()
+    entries: List[Tuple[str, str]] = []
+    for delta in diff.deltas:
+        path = delta.new_file.path
+        if path.startswith("docs/") and path.endswith(".md"):
+            entries.append((delta.status_char(), path))
+    return entries
+
+
+def git_diff_docs(base: str, head: str) -> List[Tuple[str, str]]:
+    """Return (status_code, path) for changed markdown files under docs/.
+
+    Prefers pygit2 when installed; otherwise uses `git diff -z`, which parses
+    paths with tabs/newlines correctly and streams the NUL-delimited output
+    instead of materializing one big str. Non-docs entries are rejected at
+    the bytes level before any UTF-8 decode.
+    """
+    if pygit2 is not None:
+        return _diff_docs_pygit2(base, head)
+    proc = subprocess.Popen(
+        ["git", "diff", "--name-status", "-z", base, head],
+        stdout=subprocess.PIPE,
+    )
+    assert proc.stdout is not None
+    entries: List[Tuple[str, str]] = []
+    fields = _nul_fields(proc.stdout)
+    for status in fields:
+        if not status:
+            continue
+        path = next(fields, b"")
+        if status[:1] in (b"R", b"C"):
+            # Rename/copy entries carry old then new path; log the new one.
+            path = next(fields, b"")
+        if path.startswith(b"docs/") and path.endswith(b".md"):
+            entries.append((status[:1].decode(), path.decode("utf-8")))
+    if proc.wait() != 0:
+        raise RuntimeError(
+            f"git diff --name-status {base} {head} failed (exit {proc.returncode})"
+        )
+    return entries
 
 
 def main() -> None:
@@ -47,23 +100,22 @@ def main() -> None:
     parser.add_argument("actor")
     args = parser.parse_args()
 
-    status_lines = git_diff_status(args.base, args.head)
-    entries: List[tuple[str, Path]] = []
-    for line in status_lines:
-        entries.extend(parse_status(line))
-
-    docs_entries = [item for item in entries if item[1].suffix == ".md" and item[1].parts[0] == "docs"]
+    docs_entries = git_diff_docs(args.base, args.head)
     if not docs_entries:
         return
 
     log_path = Path("docs/revision_log.csv")
     timestamp = dt.datetime.utcnow().isoformat(timespec="seconds") + "Z"
 
-    with log_path.open("a", encoding="utf-8", newline="") as handle:
-        writer = csv.writer(handle)
-        for code, path in docs_entries:
-            action = ACTION_MAP.get(code, "modified")
-            writer.writerow([timestamp, args.actor, str(path), action, "CI validation"])
+    rows = [
+        [timestamp, args.actor, path, ACTION_MAP.get(code, "modified"), "CI validation"]
+        for code, path in docs_entries
+    ]
+    # Append through an explicit 64KB binary buffer so a big batch of rows
+    # reaches the log in a handful of grouped writes rather than per-row.
+    with log_path.open("ab", buffering=64 * 1024) as raw:
+        with io.TextIOWrapper(raw, encoding="utf-8", newline="") as handle:
+            csv.writer(handle).writerows(rows)
 
 
 if __name__ == "__main__":
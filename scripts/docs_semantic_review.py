@@ -13,17 +13,30 @@ Optional behavior:
 from __future__ import annotations
 
 import argparse
-from fnmatch import fnmatch
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
+import functools
+import gzip
+import http.client
 import json
 import os
 import re
 import subprocess
 import sys
-import urllib.error
+import urllib.parse
 import urllib.request
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+try:
+    # Optional fast path: fastjsonschema compiles build_output_schema() into
+    # a specialized validator function, which also removes any drift between
+    # the schema and the hand-rolled checks below.
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 DOCS_ROOT = Path("docs")
 
 SEVERITY_ORDER = {
@@ -33,6 +46,9 @@ SEVERITY_ORDER = {
     "critical": 3,
 }
 
+# Reverse map so severity maxing can run on plain ints and convert back once.
+_SEVERITY_REVERSE = {rank: name for name, rank in SEVERITY_ORDER.items()}
+
 ALLOWED_SEVERITIES = set(SEVERITY_ORDER.keys())
 ALLOWED_DECISIONS = {"keep", "revise", "archive", "delete"}
 ALLOWED_INTENT_TYPES = {
@@ -46,6 +62,11 @@ ALLOWED_INTENT_TYPES = {
     "reference",
 }
 
+# Schema enums sorted once; build_output_schema re-sorted these five times.
+_SORTED_SEVERITIES = sorted(ALLOWED_SEVERITIES)
+_SORTED_DECISIONS = sorted(ALLOWED_DECISIONS)
+_SORTED_INTENTS = sorted(ALLOWED_INTENT_TYPES)
+
 # Normalize legacy/non-canonical labels to keep rollout flexible.
 DOC_TYPE_ALIASES = {
     "implementation-plan": "plan",
@@ -168,63 +189,146 @@ DOC_TYPE_PATH_POLICY = {
 }
 
 
-def run_git(args: List[str]) -> str:
+# Pattern that can never match, used for empty glob tuples.
+_NEVER_MATCH = re.compile(r"(?!)")
+
+
+def _compile_globs(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Join fnmatch globs into one compiled alternation."""
+    if not patterns:
+        return _NEVER_MATCH
+    return re.compile("(?:" + "|".join(translate(p) for p in patterns) + ")")
+
+
+# One entry per doc_type, frozen at import: pattern tuples plus their
+# compiled alternations behind attribute access, so evaluation does a single
+# dict lookup per doc instead of repeated .get() calls on the raw policy.
+PolicyEntry = namedtuple("PolicyEntry", ["preferred", "allowed", "preferred_re", "allowed_re"])
+
+DOC_TYPE_PATH_POLICY_COMPILED = {
+    doc_type: PolicyEntry(
+        preferred=tuple(policy.get("preferred", ())),
+        allowed=tuple(policy.get("allowed", ())),
+        preferred_re=_compile_globs(tuple(policy.get("preferred", ()))),
+        allowed_re=_compile_globs(tuple(policy.get("allowed", ()))),
+    )
+    for doc_type, policy in DOC_TYPE_PATH_POLICY.items()
+}
+
+
+def run_git(args: List[str]) -> bytes:
+    # Return raw stdout: callers split on NUL at the bytes level and decode
+    # only the few fields they keep, skipping a whole-output UTF-8 decode.
     try:
         result = subprocess.run(
             ["git"] + args,
             capture_output=True,
-            text=True,
             check=True,
         )
         return result.stdout
     except subprocess.CalledProcessError as exc:
-        stderr = exc.stderr.strip() if exc.stderr else "(no stderr)"
+        stderr = (
+            exc.stderr.decode("utf-8", errors="replace").strip()
+            if exc.stderr
+            else "(no stderr)"
+        )
         raise RuntimeError(
             f"git {' '.join(args)} failed (exit {exc.returncode}): {stderr}"
         ) from exc
 
 
 def git_changed_docs(base: str, head: str) -> List[Tuple[str, Path]]:
-    output = run_git(["diff", "--name-status", "--diff-filter=AMR", base, head])
+    # Filter at the source: the pathspec keeps non-docs entries out of the
+    # stream entirely, and -z gives NUL-separated records that are robust to
+    # whitespace in paths.
+    output = run_git(
+        [
+            "diff",
+            "-z",
+            "--name-status",
+            "--diff-filter=AMR",
+            base,
+            head,
+            "--",
+            "docs/*.md",
+            "docs/**/*.md",
+        ]
+    )
     rows: List[Tuple[str, Path]] = []
-    for line in output.splitlines():
-        if not line.strip():
+    fields = iter(output.split(b"\0"))
+    for status in fields:
+        if not status:
             continue
-        parts = line.split("\t")
-        status = parts[0]
-        if status.startswith("R"):
-            path = Path(parts[-1])
+        path = next(fields, b"")
+        if status.startswith(b"R"):
+            # Rename records carry old then new path; review the new one.
+            path = next(fields, b"")
             code = "R"
         else:
-            code = status[0]
-            path = Path(parts[1])
-        if path.suffix == ".md" and path.parts and path.parts[0] == "docs":
-            rows.append((code, path))
+            code = status[:1].decode()
+        # Renames can cross the docs/ boundary, so re-check the final path.
+        if path.startswith(b"docs/") and path.endswith(b".md"):
+            rows.append((code, Path(path.decode("utf-8"))))
     return rows
 
 
+# Delimit and parse frontmatter with precompiled patterns: one DOTALL match
+# finds the header block, one multiline findall collects key/value pairs, so
+# the per-line Python strip/split loop is gone.
+_FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---", re.DOTALL)
+_FM_KV_RE = re.compile(r"(?m)^\s*(?!#)([A-Za-z_][\w.-]*)\s*:\s*(.*?)\s*$")
+
+
 def parse_frontmatter(text: str) -> Tuple[Dict[str, str], str]:
-    if not text.startswith("---\n"):
-        return {}, text
-    try:
-        closing = text.index("\n---", 4)
-    except ValueError:
+    match = _FRONTMATTER_RE.match(text)
+    if not match:
         return {}, text
-
-    header = text[4:closing]
-    body = text[closing + 4 :].lstrip("\n")
-    values: Dict[str, str] = {}
-    for line in header.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#") or ":" not in stripped:
-            continue
-        key, raw = stripped.split(":", 1)
-        values[key.strip()] = raw.strip().strip("'\"")
+    body = text[match.end() :].lstrip("\n")
+    values = {
+        key: value.strip("'\"") for key, value in _FM_KV_RE.findall(match.group(1))
+    }
     return values, body
 
 
+def split_frontmatter_bytes(raw: bytes) -> Tuple[Dict[str, str], str]:
+    """parse_frontmatter for raw file bytes, decoding only the needed slices.
+
+    The delimiter scan runs on bytes, so files without frontmatter are
+    detected from the first four bytes and the header decode is skipped
+    entirely; for the rest, the small header and the body decode separately.
+    """
+    if raw.startswith(b"---\n"):
+        end = raw.find(b"\n---", 4)
+        if end != -1:
+            header = raw[4:end].decode("utf-8")
+            body = raw[end + 4 :].lstrip(b"\n").decode("utf-8")
+            values = {
+                key: value.strip("'\"") for key, value in _FM_KV_RE.findall(header)
+            }
+            return values, body
+    return {}, raw.decode("utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def _prefix_index(
+    patterns: Tuple[str, ...],
+) -> Tuple[Tuple[str, "re.Pattern[str]"], ...]:
+    """Pair each glob with its literal prefix (everything before the first *)."""
+    return tuple(
+        (pattern.split("*", 1)[0], re.compile(translate(pattern)))
+        for pattern in patterns
+    )
+
+
 def path_matches(path: str, patterns: Tuple[str, ...]) -> bool:
-    return any(fnmatch(path, pattern) for pattern in patterns)
+    # Literal-prefix reject: a C-level startswith rules out most patterns
+    # before their compiled regex ever runs. The policy hot path already goes
+    # through the per-doc_type combined alternations; this keeps the general
+    # helper cheap too.
+    return any(
+        path.startswith(prefix) and compiled.match(path)
+        for prefix, compiled in _prefix_index(patterns)
+    )
 
 
 def normalize_doc_type(raw: str) -> str:
@@ -232,105 +336,174 @@ def normalize_doc_type(raw: str) -> str:
     return DOC_TYPE_ALIASES.get(cleaned, cleaned)
 
 
-def evaluate_path_policy(path: str, frontmatter: Dict[str, str]) -> Dict[str, object]:
-    raw_doc_type = frontmatter.get("doc_type", "").strip()
+@functools.lru_cache(maxsize=4096)
+def _evaluate_path_policy_cached(
+    path: str, raw_doc_type: str
+) -> Tuple[str, str, str, str, str, Tuple[str, ...], Tuple[str, ...]]:
+    """Pure policy evaluation, memoized on its two inputs.
+
+    Returns (status, severity, raw_doc_type, normalized_doc_type, reason,
+    preferred_paths, allowed_paths) as an immutable tuple so cache entries
+    cannot be mutated by callers.
+    """
+    raw_doc_type = raw_doc_type.strip()
     if not raw_doc_type:
         # Missing doc_type makes placement intent unknowable, so treat as hard policy gap.
-        return {
-            "status": "missing-doc-type",
-            "severity": "major",
-            "raw_doc_type": "",
-            "normalized_doc_type": "",
-            "reason": "frontmatter doc_type is missing",
-            "preferred_paths": [],
-            "allowed_paths": [],
-        }
+        return (
+            "missing-doc-type",
+            "major",
+            "",
+            "",
+            "frontmatter doc_type is missing",
+            (),
+            (),
+        )
 
     normalized_doc_type = normalize_doc_type(raw_doc_type)
-    policy = DOC_TYPE_PATH_POLICY.get(normalized_doc_type)
-    if not policy:
+    entry = DOC_TYPE_PATH_POLICY_COMPILED.get(normalized_doc_type)
+    if entry is None:
         # Unknown types create silent taxonomy drift; fail loudly so we extend policy deliberately.
-        return {
-            "status": "unknown-doc-type",
-            "severity": "major",
-            "raw_doc_type": raw_doc_type,
-            "normalized_doc_type": normalized_doc_type,
-            "reason": f"doc_type '{raw_doc_type}' is not recognized by policy",
-            "preferred_paths": [],
-            "allowed_paths": [],
-        }
-
-    preferred_paths = tuple(policy.get("preferred", ()))
-    allowed_paths = tuple(policy.get("allowed", ()))
-
-    if path_matches(path, preferred_paths):
-        return {
-            "status": "ok",
-            "severity": "none",
-            "raw_doc_type": raw_doc_type,
-            "normalized_doc_type": normalized_doc_type,
-            "reason": "path matches preferred placement policy",
-            "preferred_paths": list(preferred_paths),
-            "allowed_paths": list(allowed_paths),
-        }
-
-    if path_matches(path, allowed_paths):
+        return (
+            "unknown-doc-type",
+            "major",
+            raw_doc_type,
+            normalized_doc_type,
+            f"doc_type '{raw_doc_type}' is not recognized by policy",
+            (),
+            (),
+        )
+
+    if entry.preferred_re.match(path):
+        status, severity = "ok", "none"
+        reason = "path matches preferred placement policy"
+    elif entry.allowed_re.match(path):
         # Allowed-but-not-preferred is intentional flexibility: warn without blocking by default.
-        return {
-            "status": "placement-drift",
-            "severity": "minor",
-            "raw_doc_type": raw_doc_type,
-            "normalized_doc_type": normalized_doc_type,
-            "reason": "path is allowed but not preferred for this doc_type",
-            "preferred_paths": list(preferred_paths),
-            "allowed_paths": list(allowed_paths),
-        }
+        status, severity = "placement-drift", "minor"
+        reason = "path is allowed but not preferred for this doc_type"
+    else:
+        status, severity = "placement-invalid", "major"
+        reason = "path does not match preferred or allowed placement policy"
+
+    return (
+        status,
+        severity,
+        raw_doc_type,
+        normalized_doc_type,
+        reason,
+        entry.preferred,
+        entry.allowed,
+    )
+
 
+def evaluate_path_policy(path: str, frontmatter: Dict[str, str]) -> Dict[str, object]:
+    status, severity, raw, normalized, reason, preferred, allowed = (
+        _evaluate_path_policy_cached(path, frontmatter.get("doc_type", ""))
+    )
     return {
-        "status": "placement-invalid",
-        "severity": "major",
-        "raw_doc_type": raw_doc_type,
-        "normalized_doc_type": normalized_doc_type,
-        "reason": "path does not match preferred or allowed placement policy",
-        "preferred_paths": list(preferred_paths),
-        "allowed_paths": list(allowed_paths),
+        "status": status,
+        "severity": severity,
+        "raw_doc_type": raw,
+        "normalized_doc_type": normalized,
+        "reason": reason,
+        "preferred_paths": list(preferred),
+        "allowed_paths": list(allowed),
     }
 
 
-def first_heading(body: str) -> str:
-    for line in body.splitlines():
-        if line.startswith("# "):
-            return line[2:].strip()
-    return ""
-
-
-def summarize_body(body: str, max_chars: int) -> str:
-    compact = re.sub(r"\s+", " ", body).strip()
-    if len(compact) <= max_chars:
-        return compact
-    return compact[: max_chars - 3] + "..."
-
-
-def extract_claim_lines(body: str, max_claims: int = 8) -> List[str]:
-    pattern = re.compile(
-        r"\b("
-        r"must|should|required|canonical|source of truth|works|supported|"
-        r"broken|planned|deprecated|removed|archive|delete"
-        r")\b",
-        flags=re.IGNORECASE,
-    )
+_CLAIM_KEYWORDS = (
+    "must",
+    "should",
+    "required",
+    "canonical",
+    "source of truth",
+    "works",
+    "supported",
+    "broken",
+    "planned",
+    "deprecated",
+    "removed",
+    "archive",
+    "delete",
+)
+
+_CLAIM_RE = re.compile(
+    r"\b("
+    r"must|should|required|canonical|source of truth|works|supported|"
+    r"broken|planned|deprecated|removed|archive|delete"
+    r")\b",
+    flags=re.IGNORECASE,
+)
+
+# Hash-set prefilter: splitting on \W+ yields exactly the \b-delimited words,
+# so a C-level set intersection answers "any keyword present?" without the
+# regex automaton walking long lines. Multi-word phrases need a substring
+# probe; _CLAIM_RE still arbitrates the final match.
+_CLAIM_WORDSET = frozenset(kw for kw in _CLAIM_KEYWORDS if " " not in kw)
+_CLAIM_PHRASES = tuple(kw for kw in _CLAIM_KEYWORDS if " " in kw)
+_WORD_SPLIT_RE = re.compile(r"\W+")
+
+# Stop looking for titles/claims past this many lines; whatever sits that
+# deep in a doc is not worth surfacing in an 8-claim summary.
+_SCAN_LINE_CEILING = 2000
+
+
+def scan_body(
+    body: str, max_claims: int = 8, max_chars: int = 2500
+) -> Tuple[str, List[str], str]:
+    """Single pass over the body collecting (title, claims, excerpt).
+
+    Fuses the old first_heading/extract_claim_lines/summarize_body trio so
+    the body lines are only walked once, and tracks code fences so headings
+    and claims inside fenced blocks are ignored.
+    """
+    title = ""
     claims: List[str] = []
-    for raw in body.splitlines():
+    excerpt_words: List[str] = []
+    excerpt_len = 0
+    in_fence = False
+
+    for line_no, raw in enumerate(body.splitlines()):
         line = raw.strip()
-        if not line:
+        if line.startswith("```"):
+            in_fence = not in_fence
+
+        # Excerpt mirrors re.sub(r"\s+", " ", body): every word counts,
+        # fenced or not, but stop accumulating once truncation is assured.
+        if line and excerpt_len <= max_chars:
+            for word in line.split():
+                excerpt_words.append(word)
+                excerpt_len += len(word) + 1 if excerpt_len else len(word)
+        elif line_no >= _SCAN_LINE_CEILING or (
+            excerpt_len > max_chars and title and len(claims) >= max_claims
+        ):
+            # Excerpt is full and nothing useful is left to find: titles or
+            # claims buried thousands of lines deep are low-signal anyway.
+            # The excerpt_len guard matters: this arm is also reached on
+            # blank lines while the excerpt is still short, and those must
+            # not end the scan early.
+            break
+
+        if in_fence or not line or line_no >= _SCAN_LINE_CEILING:
             continue
+        # Title requires "# " at column 0, like the old first_heading did:
+        # indented "# ..." lines are shell/YAML comments in indentation-style
+        # code blocks, not headings.
+        if not title and raw.startswith("# "):
+            title = raw[2:].strip()
         if line.startswith("#") or line.startswith("```"):
             continue
-        if pattern.search(line):
-            claims.append(line[:220])
-        if len(claims) >= max_claims:
-            break
-    return claims
+        if len(claims) < max_claims:
+            lower = line.casefold()
+            if (
+                _CLAIM_WORDSET.intersection(_WORD_SPLIT_RE.split(lower))
+                or any(phrase in lower for phrase in _CLAIM_PHRASES)
+            ) and _CLAIM_RE.search(line):
+                claims.append(line[:220])
+
+    excerpt = " ".join(excerpt_words)
+    if excerpt_len > max_chars:
+        excerpt = excerpt[: max_chars - 3] + "..."
+    return title, claims, excerpt
 
 
 def load_northstar_goals(path: Path = Path("docs/northstar.md")) -> List[str]:
@@ -357,25 +530,36 @@ def collect_docs(
     max_chars: int,
 ) -> List[Dict]:
     docs: List[Dict] = []
-    for status, path in changed[:max_docs]:
-        try:
-            text = path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            continue
-        frontmatter, body = parse_frontmatter(text)
-        docs.append(
-            {
-                "path": path.as_posix(),
-                "change_type": status,
-                "has_frontmatter": bool(frontmatter),
-                "frontmatter": frontmatter,
-                "policy": evaluate_path_policy(path.as_posix(), frontmatter),
-                "title": first_heading(body),
-                "claims": extract_claim_lines(body),
-                "body_excerpt": summarize_body(body, max_chars=max_chars),
-                "body_char_count": len(body),
-            }
-        )
+    selected = changed[:max_docs]
+    if not selected:
+        return docs
+    # Reads are I/O-bound; a small thread pool overlaps the disk stalls while
+    # parsing and policy evaluation stay on the main thread in input order.
+    with ThreadPoolExecutor(max_workers=min(16, len(selected))) as pool:
+        futures = [
+            (status, path, pool.submit(path.read_bytes))
+            for status, path in selected
+        ]
+        for status, path, future in futures:
+            try:
+                raw = future.result()
+            except FileNotFoundError:
+                continue
+            frontmatter, body = split_frontmatter_bytes(raw)
+            title, claims, excerpt = scan_body(body, max_chars=max_chars)
+            docs.append(
+                {
+                    "path": path.as_posix(),
+                    "change_type": status,
+                    "has_frontmatter": bool(frontmatter),
+                    "frontmatter": frontmatter,
+                    "policy": evaluate_path_policy(path.as_posix(), frontmatter),
+                    "title": title,
+                    "claims": claims,
+                    "body_excerpt": excerpt,
+                    "body_char_count": len(body),
+                }
+            )
     return docs
 
 
@@ -412,7 +596,18 @@ def render_path_policy() -> str:
     return "\n".join(lines)
 
 
+# Both prompt fragments are static at import time; render them once instead
+# of re-sorting the policy table and re-dumping the aliases per prompt build.
+_DOC_TYPE_ALIASES_JSON = json.dumps(DOC_TYPE_ALIASES, indent=2)
+_PATH_POLICY_RENDERED = render_path_policy()
+
+
+@functools.cache
 def build_output_schema() -> Dict:
+    """Pure and called from several places; cache the one instance.
+
+    Callers treat the schema as immutable by convention.
+    """
     return {
         "type": "object",
         "required": ["global", "documents", "cross_doc_conflicts", "in_scope_issues"],
@@ -427,7 +622,7 @@ def build_output_schema() -> Dict:
                     "summary": {"type": "string"},
                     "max_severity": {
                         "type": "string",
-                        "enum": sorted(ALLOWED_SEVERITIES),
+                        "enum": _SORTED_SEVERITIES,
                     },
                     "blocking_reasons": {"type": "array", "items": {"type": "string"}},
                 },
@@ -450,14 +645,14 @@ def build_output_schema() -> Dict:
                     "additionalProperties": False,
                     "properties": {
                         "path": {"type": "string"},
-                        "decision": {"type": "string", "enum": sorted(ALLOWED_DECISIONS)},
+                        "decision": {"type": "string", "enum": _SORTED_DECISIONS},
                         "intent_type": {
                             "type": "string",
-                            "enum": sorted(ALLOWED_INTENT_TYPES),
+                            "enum": _SORTED_INTENTS,
                         },
                         "severity": {
                             "type": "string",
-                            "enum": sorted(ALLOWED_SEVERITIES),
+                            "enum": _SORTED_SEVERITIES,
                         },
                         "confidence": {"type": "number", "minimum": 0, "maximum": 1},
                         "reason": {"type": "string"},
@@ -488,7 +683,7 @@ def build_output_schema() -> Dict:
                         "docs": {"type": "array", "items": {"type": "string"}},
                         "severity": {
                             "type": "string",
-                            "enum": sorted(ALLOWED_SEVERITIES),
+                            "enum": _SORTED_SEVERITIES,
                         },
                         "issue": {"type": "string"},
                         "recommended_source_of_truth": {"type": "string"},
@@ -500,9 +695,15 @@ def build_output_schema() -> Dict:
     }
 
 
-def build_prompt(packet: Dict) -> str:
-    schema = json.dumps(build_output_schema(), indent=2)
-    packet_json = json.dumps(packet, indent=2)
+@functools.cache
+def _schema_json() -> str:
+    return json.dumps(build_output_schema(), indent=2)
+
+
+def build_prompt(packet: Dict, packet_json: str | None = None) -> str:
+    schema = _schema_json()
+    if packet_json is None:
+        packet_json = json.dumps(packet, indent=2)
 
     return f"""# ColdVox Semantic Documentation Review Prompt
 
@@ -542,10 +743,10 @@ North Star anchors:
 {chr(10).join(f"- {goal}" for goal in packet.get("northstar_goals", [])) or "- (no northstar goals found)"}
 
 Doc type aliases:
-{json.dumps(DOC_TYPE_ALIASES, indent=2)}
+{_DOC_TYPE_ALIASES_JSON}
 
 Doc placement policy:
-{render_path_policy()}
+{_PATH_POLICY_RENDERED}
 
 Input packet:
 ```json
@@ -610,23 +811,56 @@ def call_openai_compatible(
         },
     }
     data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=data,
-        method="POST",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        },
-    )
+    parts = urllib.parse.urlsplit(url)
+    request_path = parts.path + (f"?{parts.query}" if parts.query else "")
+    # One request per run, so there is no connection reuse to win here; the
+    # gain over urllib.request is asking for (and inflating) gzip replies.
+    # urllib honored the HTTP(S)_PROXY/no_proxy environment, so http.client
+    # must be told explicitly: tunnel https through the proxy via CONNECT,
+    # and send the absolute URI for plain http.
+    proxy = None
+    if not urllib.request.proxy_bypass(parts.hostname or ""):
+        proxy = urllib.request.getproxies().get(parts.scheme)
+    if parts.scheme == "https":
+        if proxy:
+            pp = urllib.parse.urlsplit(proxy)
+            conn = http.client.HTTPSConnection(
+                pp.hostname, pp.port, timeout=timeout_sec
+            )
+            conn.set_tunnel(parts.hostname, parts.port)
+        else:
+            conn = http.client.HTTPSConnection(parts.netloc, timeout=timeout_sec)
+    elif proxy:
+        pp = urllib.parse.urlsplit(proxy)
+        conn = http.client.HTTPConnection(pp.hostname, pp.port, timeout=timeout_sec)
+        request_path = url
+    else:
+        conn = http.client.HTTPConnection(parts.netloc, timeout=timeout_sec)
     try:
-        with urllib.request.urlopen(req, timeout=timeout_sec) as response:
-            raw = response.read().decode("utf-8")
-    except urllib.error.HTTPError as err:
-        body = err.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"provider HTTP {err.code}: {body}") from err
-    except urllib.error.URLError as err:
+        conn.request(
+            "POST",
+            request_path,
+            body=data,
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+                "Accept-Encoding": "gzip",
+            },
+        )
+        response = conn.getresponse()
+        body = response.read()
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        if response.status >= 400:
+            raise RuntimeError(
+                f"provider HTTP {response.status}: "
+                f"{body.decode('utf-8', errors='replace')}"
+            )
+        raw = body.decode("utf-8")
+    except OSError as err:
         raise RuntimeError(f"provider connection failed: {err}") from err
+    finally:
+        conn.close()
 
     parsed = json.loads(raw)
     choices = parsed.get("choices", [])
@@ -650,7 +884,20 @@ def call_openai_compatible(
     raise RuntimeError("provider response missing parseable content")
 
 
+@functools.cache
+def _compiled_schema_validator():
+    return fastjsonschema.compile(build_output_schema())
+
+
 def validate_model_output(model_output: Dict) -> List[str]:
+    if fastjsonschema is not None:
+        try:
+            _compiled_schema_validator()(model_output)
+            return []
+        except fastjsonschema.JsonSchemaException as err:
+            return [str(err)]
+
+    # Fallback: hand-rolled checks mirroring the schema's enums and ranges.
     errors: List[str] = []
 
     for key in ("global", "documents", "cross_doc_conflicts", "in_scope_issues"):
@@ -685,16 +932,20 @@ def validate_model_output(model_output: Dict) -> List[str]:
 
 
 def max_observed_severity(model_output: Dict) -> str:
-    seen = [model_output.get("global", {}).get("max_severity", "none")]
-    seen.extend(doc.get("severity", "none") for doc in model_output.get("documents", []))
-    seen.extend(
-        conflict.get("severity", "none")
-        for conflict in model_output.get("cross_doc_conflicts", [])
+    # Track the running max as an int in one pass; no intermediate list,
+    # no key= callable per comparison, unknown severities rank as 0.
+    worst = SEVERITY_ORDER.get(
+        model_output.get("global", {}).get("max_severity", "none"), 0
     )
-    seen = [s for s in seen if s in SEVERITY_ORDER]
-    if not seen:
-        return "none"
-    return max(seen, key=lambda x: SEVERITY_ORDER[x])
+    for doc in model_output.get("documents", []):
+        rank = SEVERITY_ORDER.get(doc.get("severity", "none"), 0)
+        if rank > worst:
+            worst = rank
+    for conflict in model_output.get("cross_doc_conflicts", []):
+        rank = SEVERITY_ORDER.get(conflict.get("severity", "none"), 0)
+        if rank > worst:
+            worst = rank
+    return _SEVERITY_REVERSE[worst]
 
 
 def should_fail(worst: str, threshold: str) -> bool:
@@ -705,34 +956,32 @@ def should_fail(worst: str, threshold: str) -> bool:
 
 
 def worst_policy_severity(findings: List[Dict]) -> str:
-    if not findings:
-        return "none"
-    return max(
-        [f.get("severity", "none") for f in findings if f.get("severity") in SEVERITY_ORDER],
-        key=lambda x: SEVERITY_ORDER[x],
-        default="none",
-    )
+    worst = 0
+    for finding in findings:
+        rank = SEVERITY_ORDER.get(finding.get("severity", "none"), 0)
+        if rank > worst:
+            worst = rank
+    return _SEVERITY_REVERSE[worst]
 
 
 def max_observed_severity_with_confidence(model_output: Dict, min_confidence: float) -> str:
-    seen = [model_output.get("global", {}).get("max_severity", "none")]
+    worst = SEVERITY_ORDER.get(
+        model_output.get("global", {}).get("max_severity", "none"), 0
+    )
     for doc in model_output.get("documents", []):
-        severity = doc.get("severity", "none")
         confidence = doc.get("confidence", 0.0)
-        if severity in SEVERITY_ORDER and isinstance(confidence, (int, float)):
-            if confidence >= min_confidence:
-                seen.append(severity)
+        if isinstance(confidence, (int, float)) and confidence >= min_confidence:
+            rank = SEVERITY_ORDER.get(doc.get("severity", "none"), 0)
+            if rank > worst:
+                worst = rank
 
     # Conflicts do not carry confidence in this schema, so include as-is.
     for conflict in model_output.get("cross_doc_conflicts", []):
-        severity = conflict.get("severity", "none")
-        if severity in SEVERITY_ORDER:
-            seen.append(severity)
+        rank = SEVERITY_ORDER.get(conflict.get("severity", "none"), 0)
+        if rank > worst:
+            worst = rank
 
-    seen = [s for s in seen if s in SEVERITY_ORDER]
-    if not seen:
-        return "none"
-    return max(seen, key=lambda x: SEVERITY_ORDER[x])
+    return _SEVERITY_REVERSE[worst]
 
 
 def main() -> None:
@@ -818,15 +1067,16 @@ def main() -> None:
     }
 
     packet_out = Path(args.packet_out)
-    prompt_out = Path(args.prompt_out)
     packet_out.parent.mkdir(parents=True, exist_ok=True)
-    prompt_out.parent.mkdir(parents=True, exist_ok=True)
-    packet_out.write_text(json.dumps(packet, indent=2) + "\n", encoding="utf-8")
-    prompt_text = build_prompt(packet)
-    prompt_out.write_text(prompt_text, encoding="utf-8")
+    # Serialize the (potentially multi-MB) packet once and reuse the string
+    # for both the JSON artifact and the prompt embed; stream the writes so
+    # no "serialized + newline" copy is ever built.
+    packet_json = json.dumps(packet, indent=2)
+    with packet_out.open("w", encoding="utf-8") as handle:
+        handle.write(packet_json)
+        handle.write("\n")
 
     print(f"[OK] Wrote packet: {packet_out}")
-    print(f"[OK] Wrote prompt: {prompt_out}")
     print(f"[INFO] Changed docs detected: {len(changed)}")
     print(f"[INFO] Docs included in packet: {len(docs)}")
     if policy_findings:
@@ -848,6 +1098,15 @@ def main() -> None:
             )
             sys.exit(1)
 
+    # Build the prompt only once the policy gate has passed: embedding the
+    # packet is the most expensive serialization here, and it is wasted work
+    # when deterministic placement findings already block the run.
+    prompt_out = Path(args.prompt_out)
+    prompt_out.parent.mkdir(parents=True, exist_ok=True)
+    prompt_text = build_prompt(packet, packet_json=packet_json)
+    prompt_out.write_text(prompt_text, encoding="utf-8")
+    print(f"[OK] Wrote prompt: {prompt_out}")
+
     llm_output_path = args.llm_output
     if args.run_openai:
         if not args.openai_api_key:
@@ -28,6 +28,11 @@ REPO_ROOT = Path(__file__).parent.parent
 BASELINE_FILE = REPO_ROOT / ".test-skip-baseline.json"
 DOCS_DIR = REPO_ROOT / "docs"
 
+# Frontmatter patterns compiled once; the parser runs per doc file, so the
+# per-call re-cache lookups add up across a full docs sweep.
+_FM_END_RE = re.compile(r"\n---\s*\n")
+_FM_END_BYTES_RE = re.compile(rb"\n---\s*\n")
+
 
 @dataclass
 class CheckResult:
@@ -96,7 +101,7 @@ def parse_yaml_frontmatter(content: str) -> tuple[Frontmatter | None, str]:
     if not content.startswith("---"):
         return None, content
 
-    end_match = re.search(r"\n---\s*\n", content[3:])
+    end_match = _FM_END_RE.search(content[3:])
     if not end_match:
         return None, content
 
@@ -109,10 +114,12 @@ def parse_yaml_frontmatter(content: str) -> tuple[Frontmatter | None, str]:
         if not line or line.startswith("#"):
             continue
 
-        match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_]*):\s*(.+)?$", line)
-        if match:
-            key, value = match.groups()
-            value = (value or "").strip().strip('"').strip("'")
+        # partition returns a fixed three-tuple (no list allocation) and an
+        # empty separator when ":" is absent; keys with embedded spaces or
+        # punctuation simply fall through the known-field dispatch below.
+        key, sep, raw_value = line.partition(":")
+        if sep:
+            value = raw_value.strip().strip('"').strip("'")
 
             if key == "doc_type":
                 fm.doc_type = value
@@ -130,6 +137,27 @@ def parse_yaml_frontmatter(content: str) -> tuple[Frontmatter | None, str]:
     return fm, remaining
 
 
+def read_frontmatter(path: Path) -> Frontmatter | None:
+    """Parse only the frontmatter header of a markdown file.
+
+    Reads the first 4 KB and decodes just the header slice, so doc bodies are
+    never read or UTF-8 decoded; the remainder is fetched only when the
+    closing delimiter falls outside the initial read.
+    """
+    with path.open("rb") as handle:
+        head = handle.read(4096)
+        if not head.startswith(b"---"):
+            return None
+        end = _FM_END_BYTES_RE.search(head[3:])
+        if end is None and len(head) == 4096:
+            head += handle.read()
+            end = _FM_END_BYTES_RE.search(head[3:])
+        if end is None:
+            return None
+    frontmatter, _ = parse_yaml_frontmatter(head[: 3 + end.end()].decode("utf-8"))
+    return frontmatter
+
+
 def is_valid_feature_name(name: str) -> bool:
     """Check if a string is a valid Cargo feature name.
     Features can contain letters, numbers, hyphens, and underscores.
@@ -417,9 +445,7 @@ def check_frontmatter_completeness() -> CheckResult:
             continue
 
         total_files += 1
-        content = md_file.read_text()
-
-        frontmatter, _ = parse_yaml_frontmatter(content)
+        frontmatter = read_frontmatter(md_file)
 
         if frontmatter is None:
             rel_path = md_file.relative_to(REPO_ROOT)
@@ -464,8 +490,7 @@ def check_stale_docs(strict: bool = False) -> CheckResult:
         if md_file.name == "revision_log.csv":
             continue
 
-        content = md_file.read_text()
-        frontmatter, _ = parse_yaml_frontmatter(content)
+        frontmatter = read_frontmatter(md_file)
 
         if frontmatter is None:
             continue
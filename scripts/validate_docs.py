@@ -5,18 +5,81 @@ Validates that documentation files are properly formatted and referenced.
 """
 
 import argparse
+import json
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _docs_cache import walk_md
 
-def validate_docs(base: str, head: str) -> int:
+CACHE_NAME = ".validate_docs_cache.json"
+
+# Compiled once; bounded character classes instead of lazy .*? so malformed
+# markdown cannot trigger pathological backtracking.
+_LINK_RE = re.compile(r"\[[^\]\n]{0,200}\]\(([^)\s]+)\)")
+
+
+def _check_empty(content: str, md_file: Path, repo_root: Path) -> list:
+    """Check for empty files."""
+    if not content.strip():
+        return [f"Empty documentation file: {md_file.relative_to(repo_root)}"]
+    return []
+
+
+def _check_links(
+    content: str, md_file: Path, repo_root: Path, existing: frozenset
+) -> list:
+    """Check internal markdown links against a prebuilt file index.
+
+    `existing` holds the docs-relative posix path of every markdown file
+    found by the single directory walk, so each link costs one set lookup
+    instead of a stat syscall.
+    """
+    issues = []
+    docs_dir = repo_root / "docs"
+    for link in _LINK_RE.findall(content):
+        target = link.split("#", 1)[0]
+        if not target.endswith(".md") or "://" in target or target.startswith("/"):
+            continue
+        resolved = Path(os.path.normpath(md_file.parent / target))
+        try:
+            rel = resolved.relative_to(docs_dir).as_posix()
+        except ValueError:
+            # Points outside docs/; the placement hook owns those.
+            continue
+        if rel not in existing:
+            issues.append(
+                f"Broken link in {md_file.relative_to(repo_root)}: {link}"
+            )
+    return issues
+
+
+def _validate_one(md_file: Path, repo_root: Path, existing: frozenset) -> tuple:
+    """Validate a single doc file, returning (issues, warnings).
+
+    The file is read exactly once and the text is threaded through every
+    checker, so adding a check never adds another open/read/decode cycle.
+    Each task returns its own lists, so running these in parallel needs no
+    shared state. Broken links are warnings for now: the docs tree carries
+    pre-existing ones and fixing those is editorial work, not validation's.
+    """
+    content = md_file.read_text(encoding="utf-8")
+    issues = _check_empty(content, md_file, repo_root)
+    warnings = _check_links(content, md_file, repo_root, existing)
+    return issues, warnings
+
+
+def validate_docs(base: str, head: str, use_cache: bool = False) -> int:
     """
     Validate documentation changes between base and head refs.
-    
+
     Args:
         base: Base git ref to compare against
         head: Head git ref to compare
-        
+        use_cache: Skip files whose mtime is unchanged since the last clean run
+
     Returns:
         0 if validation passes, 1 otherwise
     """
@@ -32,28 +95,76 @@ def validate_docs(base: str, head: str) -> int:
     
     # Basic validation: check for common issues
     issues = []
-    
-    # Check for broken markdown links (simplified)
-    for md_file in docs_dir.rglob("*.md"):
-        content = md_file.read_text(encoding="utf-8")
-        
-        # Check for empty files
-        if not content.strip():
-            issues.append(f"Empty documentation file: {md_file.relative_to(repo_root)}")
-        
-        # Check for broken internal links (very basic check)
-        lines = content.split("\n")
-        for i, line in enumerate(lines, 1):
-            if "](" in line and ")" in line:
-                # Very basic link check - could be enhanced
-                pass
-    
+    warnings = []
+
+    # walk_md's os.scandir traversal answers file-type and name checks from
+    # the directory read itself, without the per-entry stat calls rglob
+    # incurs, and hands back st_mtime_ns for the cache keys below.
+    found = sorted(walk_md(str(docs_dir)))
+
+    # One walk feeds both the validation list and the link-existence index:
+    # answering "does this link target exist?" becomes a set lookup instead
+    # of a stat per link.
+    existing = frozenset(
+        Path(str_path).relative_to(docs_dir).as_posix() for str_path, _ in found
+    )
+
+    # Optional incremental mode, same mtime-keyed shape as the frontmatter
+    # cache in _docs_cache: files validated clean last run and unchanged
+    # since are skipped entirely.
+    cache_path = repo_root / CACHE_NAME
+    cache = {}
+    if use_cache:
+        try:
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            cache = {}
+
+    to_check = [
+        (str_path, mtime_ns)
+        for str_path, mtime_ns in found
+        if not (use_cache and cache.get(str_path) == mtime_ns)
+    ]
+
+    # Per-file checks are independent reads, so a thread pool overlaps the
+    # I/O; map() keeps results in walk order.
+    results = []
+    if to_check:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(to_check))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(
+                pool.map(
+                    lambda item: _validate_one(Path(item[0]), repo_root, existing),
+                    to_check,
+                )
+            )
+    for file_issues, file_warnings in results:
+        issues.extend(file_issues)
+        warnings.extend(file_warnings)
+
+    if use_cache:
+        for (str_path, mtime_ns), (file_issues, file_warnings) in zip(
+            to_check, results
+        ):
+            if file_issues or file_warnings:
+                cache.pop(str_path, None)
+            else:
+                cache[str_path] = mtime_ns
+        seen = {str_path for str_path, _ in found}
+        cache = {key: value for key, value in cache.items() if key in seen}
+        cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+    if warnings:
+        print("\n⚠️  Documentation warnings (non-blocking):")
+        for warning in warnings:
+            print(f"   - {warning}")
+
     if issues:
         print("\n⚠️  Documentation issues found:")
         for issue in issues:
             print(f"   - {issue}")
         return 1
-    
+
     print("✅ Documentation validation passed")
     return 0
 
@@ -75,9 +186,15 @@ def main():
         help="Head git ref (default: HEAD)"
     )
     
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Skip files unchanged since the last clean run"
+    )
+
     args = parser.parse_args()
-    
-    sys.exit(validate_docs(args.base, args.head))
+
+    sys.exit(validate_docs(args.base, args.head, use_cache=args.cache))
 
 
 if __name__ == "__main__":
@@ -10,113 +10,168 @@ Rules:
 Exit non-zero with actionable errors if violations are found.
 """
 from __future__ import annotations
+import functools
 import sys
 import re
 import os
-import glob
-from typing import Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 ROOT = os.path.dirname(os.path.dirname(__file__))
 DOCS = os.path.join(ROOT, 'docs', 'domains')
 
 FRONTMATTER_RE = re.compile(r'^---\s*$')
 KEYVAL_RE = re.compile(r'^(?P<k>[A-Za-z0-9_\-]+):\s*(?P<v>.*)$')
+# Closing delimiter, searched on raw bytes to decide whether the 8 KB head
+# read captured the whole header.
+FM_END_BYTES_RE = re.compile(rb'\n---\s*\n')
 
+# Memoized: find_overview may read every file in a domain, and the main loop
+# reads the overview and non-prefixed files again. Caching on path halves the
+# open()/read() syscalls for the common layout. Callers only .get()/read the
+# returned dict, so sharing one instance per path is safe.
+@functools.lru_cache(maxsize=None)
 def read_frontmatter(path: str) -> Dict[str, str]:
     fm: Dict[str, str] = {}
+    # Only the header is consulted, so read a bounded prefix instead of
+    # materializing every line of large docs; the rare header that crosses
+    # 8 KB falls back to the rest of the file.
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        with open(path, 'rb') as f:
+            head = f.read(8192)
+            m = FM_END_BYTES_RE.search(head)
+            if m is None and len(head) == 8192:
+                head += f.read()
+                m = FM_END_BYTES_RE.search(head)
+        # Decode only through the closing delimiter when one was found;
+        # this skips the body and cannot split a multibyte character at
+        # the 8 KB read boundary.
+        lines = head[: m.end() if m else len(head)].decode('utf-8').splitlines()
     except Exception:
         return fm
 
     if not lines or not FRONTMATTER_RE.match(lines[0].strip()):
         return fm
-    # find end
-    end = None
-    for i in range(1, min(len(lines), 200)):
-        if FRONTMATTER_RE.match(lines[i].strip()):
-            end = i
-            break
-    if end is None:
-        return fm
-    for line in lines[1:end]:
-        m = KEYVAL_RE.match(line.strip())
+    # Single pass: parse key/value lines as we go and stop at the closing
+    # delimiter, instead of one loop to find the end and a second to parse.
+    # Each line is stripped once and fed to both module-compiled regexes.
+    for line in lines[1:200]:
+        stripped = line.strip()
+        if FRONTMATTER_RE.match(stripped):
+            return fm
+        m = KEYVAL_RE.match(stripped)
         if m:
             fm[m.group('k')] = m.group('v')
-    return fm
+    # No closing delimiter within the first 200 lines: not frontmatter.
+    return {}
+
+def list_md(domain_dir: str) -> List[os.DirEntry]:
+    """One scandir pass per domain; both find_overview and the naming loop
+    consume this list, replacing the glob + listdir + per-entry stat combo
+    (each glob call is itself a scandir plus fnmatch)."""
+    return [
+        e
+        for e in os.scandir(domain_dir)
+        if e.is_file(follow_symlinks=False) and e.name.endswith('.md')
+    ]
 
-def find_overview(domain_dir: str) -> Tuple[str | None, Dict[str,str]]:
+def find_overview(entries: List[os.DirEntry]) -> Tuple[str | None, Dict[str,str]]:
     # Prefer code-prefixed overview, fall back to overview.md
     candidates = []
-    for f in glob.glob(os.path.join(domain_dir, '*.md')):
-        base = os.path.basename(f)
-        if base in ('overview.md', 'index.md') or base.endswith('-overview.md'):
-            candidates.append(f)
+    for e in entries:
+        if e.name in ('overview.md', 'index.md') or e.name.endswith('-overview.md'):
+            candidates.append(e.path)
     # If none match pattern, try any file with title that looks like overview
     if not candidates:
-        for f in glob.glob(os.path.join(domain_dir, '*.md')):
-            fm = read_frontmatter(f)
+        for e in entries:
+            fm = read_frontmatter(e.path)
             title = fm.get('title','').lower()
             if 'overview' in title:
-                return f, fm
+                return e.path, fm
     for f in sorted(candidates):
         return f, read_frontmatter(f)
     return None, {}
 
+# Known default codes if frontmatter missing (fallback)
+DEFAULT_CODES = {
+    'text-injection': 'ti',
+    'stt': 'stt',
+    'vad': 'vad',
+    'gui': 'gui',
+    'audio': 'aud',
+    'foundation': 'fdn',
+    'telemetry': 'tele',
+}
+
+def validate_domain(entry: os.DirEntry) -> List[str]:
+    """Validate one domain directory, returning its error strings.
+
+    Domains are independent, so each call touches only its own directory
+    and returns a fresh list — safe to run concurrently.
+    """
+    domain = entry.name
+    errors: List[str] = []
+
+    md_entries = list_md(entry.path)
+    overview_path, fm = find_overview(md_entries)
+    # Overview and candidates live in the same directory, so basename
+    # equality is sufficient; no per-file normpath pair needed below.
+    overview_name = os.path.basename(overview_path) if overview_path else None
+    code = fm.get('domain_code') or DEFAULT_CODES.get(domain)
+    if not code:
+        errors.append(f"[{domain}] Missing domain_code in overview frontmatter and no default mapping exists. Add 'domain_code: <code>' to the overview.")
+        return errors
+
+    # Enforce filenames include code-
+    for md in sorted(md_entries, key=lambda e: e.name):
+        fn = md.name
+        # Allow old names with redirect frontmatter
+        path = md.path
+        if not fn.startswith(f"{code}-"):
+            fm2 = read_frontmatter(path)
+            if 'redirect' in fm2:
+                # Old file acting as stub is allowed
+                continue
+            # Overview exception if the overview is not yet renamed but has domain_code
+            if fn == overview_name:
+                # Encourage rename but don't fail hard if it carries domain_code
+                errors.append(f"[{domain}] Overview file '{fn}' should be renamed to '{code}-overview.md' (has domain_code but old name). Add a redirect stub at the old path.")
+                continue
+            errors.append(f"[{domain}] File '{fn}' must include '{code}-' prefix or contain a 'redirect:' frontmatter to the new location.")
+    return errors
+
 def main() -> int:
+    # Fresh view of the tree per invocation if the module stays imported.
+    read_frontmatter.cache_clear()
     errors: list[str] = []
     if not os.path.isdir(DOCS):
         print(f"No docs/domains directory found at {DOCS}")
         return 0
 
-    # Known default codes if frontmatter missing (fallback)
-    default_codes = {
-        'text-injection': 'ti',
-        'stt': 'stt',
-        'vad': 'vad',
-        'gui': 'gui',
-        'audio': 'aud',
-        'foundation': 'fdn',
-        'telemetry': 'tele',
-    }
-
-    for domain in sorted(os.listdir(DOCS)):
-        domain_dir = os.path.join(DOCS, domain)
-        if not os.path.isdir(domain_dir):
-            continue
-
-        overview_path, fm = find_overview(domain_dir)
-        code = fm.get('domain_code') or default_codes.get(domain)
-        if not code:
-            errors.append(f"[{domain}] Missing domain_code in overview frontmatter and no default mapping exists. Add 'domain_code: <code>' to the overview.")
-            continue
-
-        # Enforce filenames include code-
-        for fn in sorted(os.listdir(domain_dir)):
-            if not fn.endswith('.md'):
-                continue
-            # Allow old names with redirect frontmatter
-            path = os.path.join(domain_dir, fn)
-            if not fn.startswith(f"{code}-"):
-                fm2 = read_frontmatter(path)
-                if 'redirect' in fm2:
-                    # Old file acting as stub is allowed
-                    continue
-                # Overview exception if the overview is not yet renamed but has domain_code
-                if overview_path and os.path.normpath(path) == os.path.normpath(overview_path):
-                    # Encourage rename but don't fail hard if it carries domain_code
-                    errors.append(f"[{domain}] Overview file '{fn}' should be renamed to '{code}-overview.md' (has domain_code but old name). Add a redirect stub at the old path.")
-                    continue
-                errors.append(f"[{domain}] File '{fn}' must include '{code}-' prefix or contain a 'redirect:' frontmatter to the new location.")
+    domains = sorted(
+        (e for e in os.scandir(DOCS) if e.is_dir(follow_symlinks=False)),
+        key=lambda e: e.name,
+    )
+    # Domains validate independently and the work is syscall-bound, so a
+    # small thread pool overlaps the directory and file reads; map() keeps
+    # the error output in sorted-domain order.
+    if domains:
+        workers = min(8, os.cpu_count() or 4, len(domains))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for domain_errors in pool.map(validate_domain, domains):
+                errors.extend(domain_errors)
 
+    # One write() instead of a print per error: a single syscall and stdout
+    # lock acquisition however large the violation list grows.
     if errors:
-        print("Documentation domain naming validation FAILED:\n")
-        for e in errors:
-            print(f"- {e}")
+        sys.stdout.write(
+            "Documentation domain naming validation FAILED:\n\n"
+            + "\n".join(f"- {e}" for e in errors)
+            + "\n"
+        )
         return 2
     else:
-        print("Documentation domain naming validation PASS")
+        sys.stdout.write("Documentation domain naming validation PASS\n")
         return 0
 
 if __name__ == '__main__':
@@ -17,16 +17,26 @@ Usage:
   ./scripts/validate_telemetry_schema.py [--fix]
 """
 
+import bisect
+import json
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple
 
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
 @dataclass
 class MetricViolation:
-    file: Path
+    # Repo-relative path string, computed once per file at scan time so the
+    # report loop does no Path arithmetic.
+    file: str
     line: int
     metric_name: str
     issue: str
@@ -34,7 +44,7 @@ class MetricViolation:
 
 
 # Valid subsystems (should match crate names and domain codes)
-VALID_SUBSYSTEMS = {
+VALID_SUBSYSTEMS = frozenset({
     "pipeline",  # Pipeline-level metrics
     "stt",  # Speech-to-text
     "vad",  # Voice activity detection
@@ -42,10 +52,10 @@ VALID_SUBSYSTEMS = {
     "text_injection",  # Text injection
     "gui",  # GUI/Overlay
     "telemetry",  # Telemetry self-monitoring
-}
+})
 
 # Valid units (enforced exact match or known suffix)
-VALID_UNITS = {
+VALID_UNITS = frozenset({
     # Time
     "us", "ms", "s", "seconds",
     # Count
@@ -60,10 +70,10 @@ VALID_UNITS = {
     "bool", "state", "active",
     # Level
     "db", "level", "rms", "peak",
-}
+})
 
 # Legacy metric names that are grandfathered in (TODO: migrate these)
-LEGACY_METRICS = {
+LEGACY_METRICS = frozenset({
     "capture_frames",
     "chunker_frames",
     "capture_errors",
@@ -77,25 +87,41 @@ LEGACY_METRICS = {
     "stt_transcription_success",
     "end_to_end_ms",
     "coldvox_ptt", # Hotkey ID, not a metric
-}
-
-# Pattern to find metric names in Rust code
-METRIC_PATTERNS = [
-    # counter!("name", ...)
-    re.compile(r'counter!\s*\(\s*"([^"]+)"'),
-    # gauge!("name", ...)
-    re.compile(r'gauge!\s*\(\s*"([^"]+)"'),
-    # histogram!("name", ...)
-    re.compile(r'histogram!\s*\(\s*"([^"]+)"'),
+})
+
+# Pattern to find metric names in Rust code. One alternation scans each
+# line once instead of dispatching four separate compiled patterns, and it
+# reports a macro call's metric exactly once (previously the string-literal
+# heuristic re-matched the name inside counter!/gauge!/histogram! calls).
+# Byte patterns: the names are pure ASCII, so matching the raw file bytes
+# skips the UTF-8 decode of every scanned file; only the matched group is
+# decoded.
+METRIC_RE = re.compile(
+    # counter!("name", ...) / gauge!(...) / histogram!(...)
+    rb'(?:counter|gauge|histogram)!\s*\(\s*"(?P<macro>[^"]+)"'
     # Metric names in string literals (heuristic)
-    re.compile(r'"(coldvox[\._][a-z\._]+)"'),
-]
+    rb'|"(?P<literal>coldvox[\._][a-z\._]+)"'
+)
+
+_NEWLINE_RE = re.compile(rb"\n")
+
+# Cheap rejection gate: a file with none of these substrings cannot match
+# METRIC_RE, and bytes.__contains__ is far faster than the regex engine at
+# saying "no". Most source files are rejected here.
+_PREFILTER_NEEDLES = (b"counter!", b"gauge!", b"histogram!", b"coldvox")
+
+# Below this many files a process pool costs more to spawn than it saves.
+_PROCESS_POOL_MIN_FILES = 16
+
+# Optional on-disk cache: path -> [mtime_ns, size, [[line, name], ...]],
+# same mtime-keyed shape as the docs validation cache, so CI reruns only
+# rescan files that actually changed.
+CACHE_NAME = ".telemetry_schema_cache.json"
 
 # Strings to ignore (e.g. filenames, log patterns)
-IGNORE_STRINGS = {
+IGNORE_PREFIXES = (
     "coldvox.log",
-    "coldvox.log.",
-}
+)
 
 
 def validate_metric_name(name: str) -> Tuple[bool, str, str]:
@@ -104,12 +130,19 @@ def validate_metric_name(name: str) -> Tuple[bool, str, str]:
 
     Returns: (is_valid, issue, suggestion)
     """
+    # The table members are identifier-like literals, which CPython interns
+    # at compile time; interning the freshly decoded name lets the set
+    # probes below short-circuit on pointer equality instead of comparing
+    # characters, and repeated metric names share one string object.
+    name = sys.intern(name)
+
     # Skip legacy metrics
     if name in LEGACY_METRICS:
         return True, "", ""
 
-    # Skip ignored strings (filenames etc)
-    if name in IGNORE_STRINGS or any(name.startswith(s) for s in IGNORE_STRINGS):
+    # Skip ignored strings (filenames etc); exact entries are their own
+    # prefixes, so one tuple-startswith call covers both cases.
+    if name.startswith(IGNORE_PREFIXES):
         return True, "", ""
 
     # Determine separator
@@ -143,37 +176,111 @@ def validate_metric_name(name: str) -> Tuple[bool, str, str]:
     return True, "", ""
 
 
-def find_metrics_in_file(file_path: Path) -> List[Tuple[int, str]]:
+def iter_rust(root: str):
+    """Yield string paths of .rs files under root.
+
+    An explicit os.scandir walk answers the file-type and suffix checks
+    from the directory read itself, without rglob's per-entry stat calls
+    and Path-object allocations.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.endswith(".rs"):
+                    yield e.path
+
+
+def find_metrics_in_file(file_path: str) -> List[Tuple[int, str]]:
     """Find all metric names in a Rust source file."""
     metrics = []
     try:
-        content = file_path.read_text(encoding="utf-8")
-        for line_num, line in enumerate(content.split("\n"), 1):
-            for pattern in METRIC_PATTERNS:
-                for match in pattern.finditer(line):
-                    metric_name = match.group(1)
-                    metrics.append((line_num, metric_name))
+        with open(file_path, "rb") as f:
+            # Map instead of read: the regex engine scans pages on demand
+            # and large generated files never get copied into the heap.
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file; nothing to scan.
+                return metrics
+            with mm:
+                if all(mm.find(needle) == -1 for needle in _PREFILTER_NEEDLES):
+                    return metrics
+                # No pattern crosses a line boundary, so scan the whole
+                # buffer once; line numbers fall out of a bisect over the
+                # newline offsets, built only once a match exists.
+                newlines = None
+                for match in METRIC_RE.finditer(mm):
+                    if newlines is None:
+                        newlines = [m.start() for m in _NEWLINE_RE.finditer(mm)]
+                    line_num = bisect.bisect_left(newlines, match.start()) + 1
+                    # Exactly one named alternative matches per hit.
+                    metrics.append(
+                        (line_num, match.group(match.lastgroup).decode("utf-8"))
+                    )
     except (IOError, UnicodeDecodeError) as e:
         print(f"Warning: Could not read {file_path}: {e}")
     return metrics
 
 
-def scan_crate(crate_path: Path) -> List[MetricViolation]:
-    """Scan a crate for metric naming violations."""
+def scan_crate(crate_path: Path, cache=None) -> List[MetricViolation]:
+    """Scan a crate for metric naming violations.
+
+    With a cache dict, files whose (mtime_ns, size) match the cached entry
+    reuse the stored metric list and are not reopened; fresh results are
+    written back into the dict for the caller to persist.
+    """
     violations = []
 
     src_dir = crate_path / "src"
     if not src_dir.exists():
         return violations
 
-    for rust_file in src_dir.rglob("*.rs"):
-        metrics = find_metrics_in_file(rust_file)
+    # Sorted for a deterministic report; rglob yielded scandir order.
+    files = sorted(iter_rust(str(src_dir)))
+
+    per_file: List = [None] * len(files)
+    to_scan = list(range(len(files)))
+    keys = {}
+    if cache is not None:
+        to_scan = []
+        for i, path in enumerate(files):
+            st = os.stat(path)
+            entry = cache.get(path)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                per_file[i] = [(line, name) for line, name in entry[2]]
+            else:
+                to_scan.append(i)
+                keys[path] = (st.st_mtime_ns, st.st_size)
+
+    # Regex scanning is CPU-bound and per-file independent, so large scan
+    # sets fan out across cores; small ones stay serial because worker
+    # spawn costs more than the scan. map() preserves file order either way.
+    scan_paths = [files[i] for i in to_scan]
+    if len(scan_paths) >= _PROCESS_POOL_MIN_FILES:
+        with ProcessPoolExecutor() as pool:
+            scanned = list(pool.map(find_metrics_in_file, scan_paths, chunksize=16))
+    else:
+        scanned = [find_metrics_in_file(f) for f in scan_paths]
+
+    for i, metrics in zip(to_scan, scanned):
+        per_file[i] = metrics
+        if cache is not None:
+            mtime_ns, size = keys[files[i]]
+            cache[files[i]] = [mtime_ns, size, [list(m) for m in metrics]]
+
+    for rust_file, metrics in zip(files, per_file):
+        rel = None
         for line_num, metric_name in metrics:
             is_valid, issue, suggestion = validate_metric_name(metric_name)
             if not is_valid:
+                if rel is None:
+                    rel = os.path.relpath(rust_file, REPO_ROOT)
                 violations.append(
                     MetricViolation(
-                        file=rust_file,
+                        file=rel,
                         line=line_num,
                         metric_name=metric_name,
                         issue=issue,
@@ -193,11 +300,24 @@ def main() -> int:
         "--fix", action="store_true", help="Suggest fixes (not implemented)"
     )
     parser.add_argument("--crate", type=str, help="Specific crate to scan")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse scan results for files unchanged since the last run",
+    )
     args = parser.parse_args()
 
-    repo_root = Path(__file__).resolve().parent.parent
+    repo_root = REPO_ROOT
     crates_dir = repo_root / "crates"
 
+    cache = None
+    cache_path = repo_root / CACHE_NAME
+    if args.cache:
+        try:
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            cache = {}
+
     all_violations = []
 
     if args.crate:
@@ -205,38 +325,48 @@ def main() -> int:
         if not crate_path.exists():
             print(f"Error: Crate '{args.crate}' not found at {crate_path}")
             return 1
-        all_violations = scan_crate(crate_path)
+        all_violations = scan_crate(crate_path, cache=cache)
     else:
         # Dynamically find all crates in crates/
         if crates_dir.exists():
             for crate_path in crates_dir.iterdir():
                 if crate_path.is_dir() and (crate_path / "Cargo.toml").exists():
-                    violations = scan_crate(crate_path)
+                    violations = scan_crate(crate_path, cache=cache)
                     all_violations.extend(violations)
 
+    if cache is not None:
+        # Entries for deleted files age out when their paths stop being
+        # scanned and rewritten; keeping them is harmless since lookups
+        # are keyed by the files actually found on disk.
+        cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
     if not all_violations:
-        print("✅ All metrics follow the naming schema!")
-        print(f"\nSchema: coldvox.{{subsystem}}.{{metric_name}}.{{unit}}")
-        print(f"Valid subsystems: {', '.join(sorted(VALID_SUBSYSTEMS))}")
+        sys.stdout.write(
+            "✅ All metrics follow the naming schema!\n"
+            "\nSchema: coldvox.{subsystem}.{metric_name}.{unit}\n"
+            f"Valid subsystems: {', '.join(sorted(VALID_SUBSYSTEMS))}\n"
+        )
         return 0
 
-    print(f"❌ Found {len(all_violations)} schema violation(s):\n")
+    # Buffer the whole report and write it once: one syscall and stdout
+    # lock acquisition regardless of the violation count.
+    out = [f"❌ Found {len(all_violations)} schema violation(s):\n\n"]
 
     for v in all_violations:
-        try:
-            rel_path = v.file.relative_to(repo_root)
-        except ValueError:
-            rel_path = v.file
-        print(f"  {rel_path}:{v.line}")
-        print(f"    Metric: '{v.metric_name}'")
-        print(f"    Issue:  {v.issue}")
-        print(f"    Fix:    {v.suggestion}")
-        print()
-
-    print("\nTo fix these issues:")
-    print("1. Rename metrics to follow: coldvox.{subsystem}.{name}.{unit}")
-    print("2. Or add legacy metric to LEGACY_METRICS in this script")
-    print("3. Update docs/domains/telemetry/tele-observability-playbook.md")
+        out.append(
+            f"  {v.file}:{v.line}\n"
+            f"    Metric: '{v.metric_name}'\n"
+            f"    Issue:  {v.issue}\n"
+            f"    Fix:    {v.suggestion}\n\n"
+        )
+
+    out.append(
+        "\nTo fix these issues:\n"
+        "1. Rename metrics to follow: coldvox.{subsystem}.{name}.{unit}\n"
+        "2. Or add legacy metric to LEGACY_METRICS in this script\n"
+        "3. Update docs/domains/telemetry/tele-observability-playbook.md\n"
+    )
+    sys.stdout.write("".join(out))
 
     return 1
 